@@ -3,72 +3,278 @@ import sys
 import os
 import time
 import json
+import socket
+import urllib.parse
+import importlib.util
 import threading
+from collections import deque
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                              QHBoxLayout, QWidget, QComboBox, QTextEdit, QLabel, 
                              QMessageBox, QSplitter, QFileDialog, QProgressBar, 
-                             QStatusBar, QToolBar, QAction, QDialog, QLineEdit)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt5.QtGui import QIcon, QFont, QTextCursor
+                             QStatusBar, QToolBar, QAction, QDialog, QLineEdit,
+                             QCheckBox)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThread, QThreadPool, QTimer,
+                          pyqtSignal, QSize)
+from PyQt5.QtGui import QIcon, QFont, QTextCursor, QTextDocument
 
-# Try to import ollama - provide helpful error if not installed
-# Try to import necessary libraries
+# Check for necessary libraries without importing them, installing any that are missing.
+# Skipped in frozen builds or when OLLAMA_GUI_SKIP_DEP_CHECK=1.
 required_packages = ["ollama", "requests"]
-missing_packages = []
-
-for package in required_packages:
-    try:
-        __import__(package)
-    except ImportError:
-        missing_packages.append(package)
-
-if missing_packages:
-    print(f"Missing required packages: {', '.join(missing_packages)}. Installing...")
-    import subprocess
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing_packages)
-        print("Packages installed successfully!")
-        # Now import them
-        import ollama
-        import requests
-    except Exception as e:
-        print(f"Failed to install packages: {e}")
-        print(f"Please install manually with: pip install {' '.join(missing_packages)}")
-        sys.exit(1)
-else:
-    import ollama
-    import requests
+
+if os.environ.get("OLLAMA_GUI_SKIP_DEP_CHECK") != "1" and not getattr(sys, "frozen", False):
+    missing_packages = [p for p in required_packages if importlib.util.find_spec(p) is None]
+
+    if missing_packages:
+        print(f"Missing required packages: {', '.join(missing_packages)}. Installing...")
+        import subprocess
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing_packages)
+            importlib.invalidate_caches()
+            print("Packages installed successfully!")
+        except Exception as e:
+            print(f"Failed to install packages: {e}")
+            print(f"Please install manually with: pip install {' '.join(missing_packages)}")
+            sys.exit(1)
+
+import ollama
+import requests
+
+# Use orjson for parsing Ollama responses when it is available
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+def _parse_ollama_host(host):
+    """Turn an OLLAMA_HOST value into a base URL, defaulting scheme and port like the ollama CLI"""
+    host = (host or '').strip()
+    port = 11434
+    scheme, _, hostport = host.partition('://')
+    if not hostport:
+        scheme, hostport = 'http', host
+    elif scheme == 'http':
+        port = 80
+    elif scheme == 'https':
+        port = 443
+
+    split = urllib.parse.urlsplit(f'{scheme}://{hostport}')
+    hostname = split.hostname or '127.0.0.1'
+    port = split.port or port
+    if ':' in hostname:
+        # urlsplit strips the brackets from IPv6 addresses
+        hostname = f'[{hostname}]'
+
+    path = split.path.strip('/')
+    if path:
+        return f'{scheme}://{hostname}:{port}/{path}'
+    return f'{scheme}://{hostname}:{port}'
+
+# Address of the Ollama server, shared by the ollama client and the HTTP session
+OLLAMA_HOST = _parse_ollama_host(os.environ.get('OLLAMA_HOST'))
+
+# Single ollama client reused by all threads instead of building one per call
+_OLLAMA = ollama.Client(host=OLLAMA_HOST)
+
+# Shared HTTP session so repeated calls to the Ollama server reuse
+# keep-alive connections instead of opening a new socket every time
+_POOL_SIZE = 10
+_SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=0)
+_SESSION.mount('http://', _adapter)
+_SESSION.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip, deflate'})
+
+# How many batch prompts the GUI runs at once, bounded by the pool size; match this
+# to the server's OLLAMA_NUM_PARALLEL
+try:
+    BATCH_CONCURRENCY = int(os.environ.get('OLLAMA_GUI_BATCH_CONCURRENCY', 4))
+except ValueError:
+    BATCH_CONCURRENCY = 4
+BATCH_CONCURRENCY = max(1, min(BATCH_CONCURRENCY, _POOL_SIZE))
+
+# Last known model list, shown on startup while the real list is refreshed
+MODEL_CACHE_PATH = os.path.expanduser("~/.cache/ollama_gui/models.json")
+
+# Instructions shown in the empty output area on startup
+WELCOME_TEXT = (
+    "Welcome to Ollama GUI!\n\n"
+    "To get started:\n"
+    "1. Click the '🚀 Initialize' button to connect to Ollama and load your models\n"
+    "2. If you don't have any models yet, use the '⬇️ Pull New Model' button\n"
+    "3. Enter your prompt in the text area above\n"
+    "4. Click 'Generate' to run the model\n\n"
+    "Make sure the Ollama service is running in the background with 'ollama serve'"
+)
+
+ABOUT_HTML = """
+<h2>Ollama GUI</h2>
+<p>Version 1.0</p>
+<p>A PyQt5-based graphical user interface for interacting with Ollama AI models.</p>
+
+<h3>MIT License</h3>
+<p>Copyright (c) 2025</p>
+
+<p>Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:</p>
+
+<p>The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.</p>
+
+<p>THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.</p>
+
+<h3>Credits</h3>
+<ul>
+<li>Created by Arun K Eswara, eswara.arun@gmail.com
+</ul>
+"""
+
+# Parsed ABOUT_HTML, built the first time the About dialog is opened
+_ABOUT_DOC = None
+
+def _shutdown_response(response):
+    """Shut down the socket behind a streaming response from any thread"""
+    raw = getattr(response, 'raw', None)
+    if raw is None:
+        return
+    # urllib3 >= 2.3 supports this directly
+    shutdown = getattr(raw, 'shutdown', None)
+    if shutdown is not None:
+        try:
+            shutdown()
+            return
+        except NotImplementedError:
+            pass
+        except (ValueError, RuntimeError, OSError):
+            # The response already finished or was closed by run(); stopping is best-effort
+            return
+    sock = getattr(getattr(raw, '_connection', None), 'sock', None)
+    if sock is None:
+        reader = getattr(getattr(raw, '_fp', None), 'fp', None)
+        sock = getattr(getattr(reader, 'raw', None), '_sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
 
 class StreamingOutputThread(QThread):
     """Thread to handle streaming responses from Ollama"""
     update_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
     error_signal = pyqtSignal(str)
+    # Used instead of the signals above when the thread is part of a batch
+    batch_update_signal = pyqtSignal(int, str)
+    batch_finished_signal = pyqtSignal(int)
+    batch_error_signal = pyqtSignal(int, str)
+
+    # Emit buffered text once it reaches this many characters or this many seconds
+    FLUSH_SIZE = 512
+    FLUSH_INTERVAL = 0.03
     
-    def __init__(self, model, prompt):
+    def __init__(self, model, prompt, index=None):
         super().__init__()
         self.model = model
         self.prompt = prompt
+        self.index = index
         self.running = True
+        self._response = None
+
+    def stop(self):
+        """Stop streaming and shut the connection down so the server frees the slot"""
+        self.running = False
+        response = self._response
+        if response is not None:
+            # Closing the response here would wait on the reader lock held by run(),
+            # so only shut the socket down and let run() close the response
+            _shutdown_response(response)
         
+    def _emit_update(self, text):
+        if self.index is None:
+            self.update_signal.emit(text)
+        else:
+            self.batch_update_signal.emit(self.index, text)
+
+    def _emit_finished(self):
+        if self.index is None:
+            self.finished_signal.emit()
+        else:
+            self.batch_finished_signal.emit(self.index)
+
+    def _emit_error(self, message):
+        if self.index is None:
+            self.error_signal.emit(message)
+        else:
+            self.batch_error_signal.emit(self.index, message)
+
     def run(self):
+        buf = []
+        buf_len = 0
+        last_flush = time.monotonic()
         try:
-            full_response = ""
-            
-            # Stream the response
-            for response in ollama.generate(model=self.model, prompt=self.prompt, stream=True):
+            payload = {"model": self.model, "prompt": self.prompt, "stream": True}
+
+            # Stream the response over the shared session; Ollama sends one JSON object per line
+            self._response = _SESSION.post(f'{OLLAMA_HOST}/api/generate', json=payload,
+                                           stream=True, timeout=(5, None))
+            with self._response as r:
                 if not self.running:
-                    break
-                    
-                if 'response' in response:
-                    chunk = response['response']
-                    full_response += chunk
-                    self.update_signal.emit(chunk)
-                    
-            self.finished_signal.emit()
+                    # Stopped while the request was being sent
+                    return
+                if not r.ok:
+                    # Ollama explains failures (e.g. a model that is not pulled) in a JSON body
+                    try:
+                        body = _loads(r.content)
+                    except ValueError:
+                        body = None
+                    if isinstance(body, dict) and body.get('error'):
+                        raise RuntimeError(body['error'])
+                    r.raise_for_status()
+                for raw in r.iter_lines():
+                    if not self.running:
+                        break
+
+                    if not raw:
+                        continue
+
+                    response = _loads(raw)
+                    if 'error' in response:
+                        raise RuntimeError(response['error'])
+                    if 'response' in response:
+                        chunk = response['response']
+                        buf.append(chunk)
+                        buf_len += len(chunk)
+                        # Coalesce tokens so the UI is not updated once per token
+                        if buf_len >= self.FLUSH_SIZE or time.monotonic() - last_flush > self.FLUSH_INTERVAL:
+                            self._emit_update(''.join(buf))
+                            buf, buf_len = [], 0
+                            last_flush = time.monotonic()
+                    if response.get('done'):
+                        break
             
         except Exception as e:
-            self.error_signal.emit(str(e))
+            # Shutting the socket down from stop() makes the read fail; that is not an error
+            if self.running:
+                self._emit_error(str(e))
+                return
+        finally:
+            self._response = None
+
+        # A stopped run must not append to, or finish, whatever the user started next
+        if not self.running:
+            return
+        if buf:
+            self._emit_update(''.join(buf))
+        self._emit_finished()
 
 class ModelLoader(QThread):
     """Thread to load models from Ollama"""
@@ -77,49 +283,40 @@ class ModelLoader(QThread):
     
     def run(self):
         try:
-            # First try the command line approach which is most reliable
             import subprocess
-            import re
-            
+
+            # First try the HTTP API, which is fast and needs no extra process
             try:
-                # Use subprocess to directly call the ollama CLI command
-                result = subprocess.check_output(["ollama", "list"], text=True)
-                
-                # Parse the output which looks like:
-                # NAME                    ID              SIZE      MODIFIED
-                # model1:latest           abc123def456    1.2 GB    4 minutes ago
-                # model2:latest           def456abc123    3.4 GB    2 days ago
-                
-                model_names = []
-                lines = result.strip().split('\n')
-                
-                # Skip header line
-                if len(lines) > 1:
-                    for line in lines[1:]:
-                        if line.strip():
-                            # Get the model name (first column)
-                            model_name = line.strip().split()[0]
-                            model_names.append(model_name)
-                
-                if model_names:
-                    self.models_loaded.emit(model_names)
-                    return
-            except (subprocess.SubprocessError, FileNotFoundError) as e:
-                # If CLI approach fails, fall back to API
-                pass
-                
-            # API approach as fallback
+                response = _SESSION.get(f'{OLLAMA_HOST}/api/tags', timeout=2)
+                response.raise_for_status()
+                data = _loads(response.content)
+                model_names = [m['name'] for m in data.get('models', []) if 'name' in m]
+                self.models_loaded.emit(model_names)
+                return
+            except (requests.ConnectionError, requests.Timeout) as err:
+                # Server not reachable over HTTP; keep the error to report if the fallbacks fail too
+                http_err = err
+
+            if self.isInterruptionRequested():
+                return
+
+            # Method 2: Try using the ollama Python API
             try:
-                # Method 1: Try using the ollama Python API
-                result = ollama.list()
+                result = _OLLAMA.list()
                 model_names = []
                 
                 # Handle different possible return formats
                 if isinstance(result, dict) and 'models' in result:
-                    # Newer API format
+                    # Older API format
                     for model in result['models']:
                         if isinstance(model, dict) and 'name' in model:
                             model_names.append(model['name'])
+                elif hasattr(result, 'models'):
+                    # ollama >= 0.4 returns a ListResponse whose entries carry the name in .model
+                    for model in result.models:
+                        name = getattr(model, 'model', None)
+                        if name:
+                            model_names.append(name)
                 elif isinstance(result, list):
                     # Direct list return
                     for model in result:
@@ -134,26 +331,71 @@ class ModelLoader(QThread):
             except Exception as api_err:
                 # Try one more approach
                 pass
-            
-            # Method 3: Use requests to directly query the Ollama API
+
+            if self.isInterruptionRequested():
+                return
+
+            # Method 3: Use subprocess to directly call the ollama CLI command
             try:
-                import requests
-                response = requests.get('http://localhost:11434/api/tags')
-                data = response.json()
+                result = subprocess.check_output(["ollama", "list"], text=True)
                 
-                model_names = []
-                if 'models' in data:
-                    for model in data['models']:
-                        if 'name' in model:
-                            model_names.append(model['name'])
+                # Parse the output which looks like:
+                # NAME                    ID              SIZE      MODIFIED
+                # model1:latest           abc123def456    1.2 GB    4 minutes ago
+                # model2:latest           def456abc123    3.4 GB    2 days ago
+                
+                # Skip header line and take the model name (first column) of each row
+                model_names = [ln.split(None, 1)[0] for ln in result.splitlines()[1:] if ln.strip()]
                 
                 self.models_loaded.emit(model_names)
-            except Exception as req_err:
-                # If all methods fail, raise the original error
-                self.error_signal.emit("Failed to retrieve models. Error: " + str(req_err))
+            except (subprocess.SubprocessError, FileNotFoundError) as cli_err:
+                # If all methods fail, report why the server could not be reached
+                self.error_signal.emit(
+                    f"Failed to retrieve models. Error: {http_err} (ollama CLI: {cli_err})"
+                )
         except Exception as e:
             self.error_signal.emit(str(e))
 
+class PingSignals(QObject):
+    """Signals used by PingRunnable to report back to the main thread"""
+    ok = pyqtSignal()
+    err = pyqtSignal(str)
+
+class PingRunnable(QRunnable):
+    """Runnable to test the connection to Ollama"""
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        try:
+            # First try the HTTP API
+            try:
+                response = _SESSION.get(f'{OLLAMA_HOST}/api/tags', timeout=(5, 30))
+                if response.status_code == 200:
+                    self.signals.ok.emit()
+                    return
+            except requests.RequestException:
+                # If that fails, try the command line
+                pass
+
+            import subprocess
+            try:
+                subprocess.check_output(["ollama", "list"], text=True)
+                self.signals.ok.emit()
+                return
+            except (subprocess.SubprocessError, FileNotFoundError):
+                # If CLI approach fails, try the Python API
+                pass
+                
+            # Last resort - try the Python API
+            _OLLAMA.list()
+            # If we got here without exception, Ollama is reachable
+            self.signals.ok.emit()
+            
+        except Exception as e:
+            self.signals.err.emit(str(e))
+
 class PullModelDialog(QDialog):
     """Dialog for pulling new models"""
     def __init__(self, parent=None):
@@ -185,6 +427,7 @@ class PullModelDialog(QDialog):
         self.progress.setVisible(False)
         layout.addWidget(self.progress)
         
+        self.pull_thread = None
         self.setLayout(layout)
         
     def pull_model(self):
@@ -194,20 +437,37 @@ class PullModelDialog(QDialog):
             return
             
         self.pull_button.setEnabled(False)
-        self.cancel_button.setEnabled(False)
         self.progress.setVisible(True)
         self.progress.setRange(0, 0)  # Indeterminate progress
         self.status_label.setText(f"Pulling model {model_name}. This may take a while...")
         
         # Pull the model in a separate thread
-        self.pull_thread = PullModelThread(model_name)
+        self.pull_thread = PullModelThread(model_name, _OLLAMA, self)
+        self.pull_thread.finished.connect(self._pull_thread_finished)
         self.pull_thread.progress_update.connect(self.update_progress)
+        self.pull_thread.progress_value.connect(self.update_progress_value)
         self.pull_thread.finished_signal.connect(self.pull_complete)
         self.pull_thread.error_signal.connect(self.pull_error)
         self.pull_thread.start()
     
+    def _pull_thread_finished(self):
+        # The thread deletes itself once it finishes
+        self.pull_thread = None
+
+    def reject(self):
+        """Cancel a pull in progress before closing the dialog"""
+        if self.pull_thread is not None:
+            self.pull_thread.requestInterruption()
+        super().reject()
+    
     def update_progress(self, text):
         self.status_label.setText(text)
+
+    def update_progress_value(self, value):
+        # Switch to a determinate bar once the download size is known
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
+        self.progress.setValue(value)
     
     def pull_complete(self):
         self.progress.setRange(0, 100)
@@ -226,42 +486,77 @@ class PullModelDialog(QDialog):
 class PullModelThread(QThread):
     """Thread to pull models from Ollama"""
     progress_update = pyqtSignal(str)
+    progress_value = pyqtSignal(int)
     finished_signal = pyqtSignal()
     error_signal = pyqtSignal(str)
     
-    def __init__(self, model_name):
-        super().__init__()
+    def __init__(self, model_name, client, parent=None):
+        super().__init__(parent)
         self.model_name = model_name
+        self.client = client
+        self.finished.connect(self.deleteLater)
         
     def run(self):
         try:
-            # Start the pull operation
+            # Start the pull operation and report progress as events arrive
             self.progress_update.emit(f"Downloading {self.model_name}...")
-            ollama.pull(self.model_name)
+            last_status = None
+            last_pct = None
+            events = self.client.pull(self.model_name, stream=True)
+            for event in events:
+                if self.isInterruptionRequested():
+                    # Closing the generator closes the HTTP response so the download stops
+                    events.close()
+                    return
+
+                status = event.get('status')
+                if status and status != last_status:
+                    self.progress_update.emit(status)
+                    last_status = status
+
+                total = event.get('total')
+                if total:
+                    pct = int(100 * (event.get('completed') or 0) / total)
+                    if pct != last_pct:
+                        self.progress_value.emit(pct)
+                        last_pct = pct
             self.finished_signal.emit()
         except Exception as e:
-            self.error_signal.emit(str(e))
+            if not self.isInterruptionRequested():
+                self.error_signal.emit(str(e))
 
 class OllamaGUI(QMainWindow):
+    # Shared fonts, created on first use since QFont needs a QApplication
+    _MONO = None
+    _BOLD = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Ollama AI Interface")
         self.setGeometry(100, 100, 1000, 800)
-        self.stream_thread = None
+        # Every streaming thread that has been started and not yet finished
+        self.stream_threads = []
+        self.model_loader = None
+        self._reload_pending = False
+        self._batch_model = None
+        self._batch_pending = deque()
+        self._batch_remaining = 0
+        self._stopping = False
+        self._last_batch_index = None
+        self._scroll_pending = False
         self.setup_ui()
         
-        # Show instruction in the output area on startup
-        self.output_text_edit.setPlainText(
-            "Welcome to Ollama GUI!\n\n"
-            "To get started:\n"
-            "1. Click the '🚀 Initialize' button to connect to Ollama and load your models\n"
-            "2. If you don't have any models yet, use the '⬇️ Pull New Model' button\n"
-            "3. Enter your prompt in the text area above\n"
-            "4. Click 'Generate' to run the model\n\n"
-            "Make sure the Ollama service is running in the background with 'ollama serve'"
-        )
+        # Populate models from the cache right away, then refresh in the background
+        self._cached_models = self._load_model_cache()
+        if self._cached_models:
+            self.update_model_list(self._cached_models)
+            QTimer.singleShot(0, self._refresh_cached_models)
 
     def setup_ui(self):
+        if OllamaGUI._MONO is None:
+            OllamaGUI._MONO = QFont("Monospace", 10)
+            OllamaGUI._BOLD = QFont("Arial", 10, QFont.Bold)
+
         # Create a central widget and main layout
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -313,8 +608,12 @@ class OllamaGUI(QMainWindow):
         self.stop_button.clicked.connect(self.stop_generation)
         self.stop_button.setEnabled(False)
         
+        self.batch_checkbox = QCheckBox("Batch mode")
+        self.batch_checkbox.setToolTip("Separate prompts with a blank line to run them concurrently")
+        
         model_selection_layout.addWidget(model_label)
         model_selection_layout.addWidget(self.model_combobox, 1)
+        model_selection_layout.addWidget(self.batch_checkbox)
         model_selection_layout.addWidget(self.run_button)
         model_selection_layout.addWidget(self.stop_button)
         
@@ -328,12 +627,12 @@ class OllamaGUI(QMainWindow):
         input_layout = QVBoxLayout(input_widget)
         
         input_label = QLabel("Enter your prompt:")
-        input_label.setFont(QFont("Arial", 10, QFont.Bold))
+        input_label.setFont(self._BOLD)
         
         self.input_text_edit = QTextEdit()
         self.input_text_edit.setPlaceholderText("Enter your prompt here...")
         self.input_text_edit.setMinimumHeight(100)
-        self.input_text_edit.setFont(QFont("Monospace", 10))
+        self.input_text_edit.setFont(self._MONO)
         
         input_layout.addWidget(input_label)
         input_layout.addWidget(self.input_text_edit)
@@ -343,12 +642,13 @@ class OllamaGUI(QMainWindow):
         output_layout = QVBoxLayout(output_widget)
         
         output_label = QLabel("Generated Output:")
-        output_label.setFont(QFont("Arial", 10, QFont.Bold))
+        output_label.setFont(self._BOLD)
         
         self.output_text_edit = QTextEdit()
         self.output_text_edit.setReadOnly(True)
-        self.output_text_edit.setPlaceholderText("Generated text will appear here...")
-        self.output_text_edit.setFont(QFont("Monospace", 10))
+        # The welcome text is painted as a placeholder, so no document is laid out for it
+        self.output_text_edit.setPlaceholderText(WELCOME_TEXT)
+        self.output_text_edit.setFont(self._MONO)
         
         output_layout.addWidget(output_label)
         output_layout.addWidget(self.output_text_edit)
@@ -399,77 +699,114 @@ class OllamaGUI(QMainWindow):
             self.progress_bar.setVisible(True)
             self.progress_bar.setRange(0, 0)  # Indeterminate progress
             
-            # Try to ping Ollama in a separate thread
-            self.ping_thread = QThread()
-            self.ping_thread.run = self._ping_ollama
-            self.ping_thread.start()
+            # Ping Ollama on a pooled thread; results come back through signals
+            self.ping_signals = PingSignals()
+            self.ping_signals.ok.connect(self._ping_succeeded)
+            self.ping_signals.err.connect(self._ping_failed)
+            QThreadPool.globalInstance().start(PingRunnable(self.ping_signals))
         else:
             # If models are already loaded, just refresh
             self.load_models()
     
-    def _ping_ollama(self):
-        """Test connection to Ollama"""
-        try:
-            # First try using command line
-            import subprocess
-            try:
-                subprocess.check_output(["ollama", "list"], text=True)
-                # If successful, load models from the main thread
-                self.load_models()
-                return
-            except (subprocess.SubprocessError, FileNotFoundError):
-                # If CLI approach fails, try the API
-                pass
-                
-            # Try direct API connection next
-            try:
-                response = requests.get('http://localhost:11434/api/tags', timeout=5)
-                if response.status_code == 200:
-                    # If successful, load models from the main thread
-                    self.load_models()
-                    return
-            except:
-                # If that fails, try the Python API
-                pass
-                
-            # Last resort - try the Python API
-            ollama.list()
-            # If we got here without exception, load models
-            self.load_models()
-            
-        except Exception as e:
-            # If Ollama is not running, show a helpful error
-            error_msg = str(e)
-            if "connection refused" in error_msg.lower():
-                QMessageBox.critical(
-                    self, 
-                    "Ollama Not Running", 
-                    "Could not connect to Ollama. Please make sure the Ollama service is running.\n\n"
-                    "Start it by opening a terminal and running:\n"
-                    "ollama serve"
-                )
-            else:
-                QMessageBox.critical(self, "Ollama Error", f"Error connecting to Ollama: {e}")
-            
-            self.status_bar.showMessage("Failed to connect to Ollama", 5000)
-            self.progress_bar.setVisible(False)
+    def _ping_succeeded(self):
+        """Load models once the Ollama connection has been confirmed"""
+        self.load_models()
+
+    def _ping_failed(self, error_msg):
+        """Show a helpful error if Ollama could not be reached"""
+        if "connection refused" in error_msg.lower():
+            QMessageBox.critical(
+                self, 
+                "Ollama Not Running", 
+                "Could not connect to Ollama. Please make sure the Ollama service is running.\n\n"
+                "Start it by opening a terminal and running:\n"
+                "ollama serve"
+            )
+        else:
+            QMessageBox.critical(self, "Ollama Error", f"Error connecting to Ollama: {error_msg}")
+        
+        self.status_bar.showMessage("Failed to connect to Ollama", 5000)
+        self.progress_bar.setVisible(False)
             
     def load_models(self):
         """Load available models from Ollama"""
+        # Don't start a second thread while a refresh is in flight; run another one after it
+        if self.model_loader and self.model_loader.isRunning():
+            self._reload_pending = True
+            return
+        
         self.status_bar.showMessage("Loading models...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
+        self._start_model_loader(self.show_error)
+
+    def _refresh_cached_models(self):
+        """Refresh the cached model list shown on startup, failing quietly"""
+        if self.model_loader and self.model_loader.isRunning():
+            return
+        
+        self.status_bar.showMessage("Refreshing models...")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        
+        self._start_model_loader(self._refresh_failed)
+
+    def _start_model_loader(self, error_slot):
         self.model_loader = ModelLoader()
         self.model_loader.models_loaded.connect(self.update_model_list)
-        self.model_loader.error_signal.connect(self.show_error)
+        self.model_loader.error_signal.connect(error_slot)
+        self.model_loader.finished.connect(self._model_loader_finished)
         self.model_loader.start()
 
+    def _model_loader_finished(self):
+        """Run a refresh that was requested while the previous one was in flight"""
+        # finished is emitted just before the thread exits, so let it exit before checking isRunning()
+        self.sender().wait()
+        if self._reload_pending:
+            self._reload_pending = False
+            self.load_models()
+
+    def _refresh_failed(self, error_message):
+        """Keep showing the cached models if the startup refresh fails"""
+        self.status_bar.showMessage(f"Could not refresh models, showing cached list: {error_message}", 5000)
+        self.progress_bar.setVisible(False)
+
+    def _load_model_cache(self):
+        """Return the cached model list, or an empty list if there is none"""
+        try:
+            with open(MODEL_CACHE_PATH, "r", encoding="utf-8") as file:
+                models = json.load(file)
+            if isinstance(models, list):
+                return [m for m in models if isinstance(m, str)]
+        except (OSError, ValueError):
+            pass
+        return []
+
+    def _save_model_cache(self, models):
+        """Atomically write the model list to the cache file"""
+        if models == self._cached_models:
+            return
+        tmp_path = MODEL_CACHE_PATH + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(MODEL_CACHE_PATH), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(models, file)
+            os.replace(tmp_path, MODEL_CACHE_PATH)
+            self._cached_models = list(models)
+        except OSError:
+            # The cache is only an optimization, so failing to write it is not an error
+            pass
+
     def update_model_list(self, models):
         """Update the model combobox with available models"""
+        current_model = self.model_combobox.currentText()
         self.model_combobox.clear()
         if models:
             self.model_combobox.addItems(models)
+            # Keep the user's selection across refreshes
+            if current_model in models:
+                self.model_combobox.setCurrentText(current_model)
             self.status_bar.showMessage(f"Loaded {len(models)} models", 3000)
         else:
             self.status_bar.showMessage("No models found. Use 'Pull New Model' to download one.", 5000)
@@ -483,6 +820,7 @@ class OllamaGUI(QMainWindow):
                 "Popular models: llama2, mistral, gemma:2b, tinyllama, phi"
             )
             
+        self._save_model_cache(models)
         self.progress_bar.setVisible(False)
 
     def run_ollama(self):
@@ -498,6 +836,11 @@ class OllamaGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please enter a prompt.")
             return
         
+        # Threads from a stopped run may still be waiting on the server
+        if self.stream_threads:
+            self.status_bar.showMessage("Previous generation is still stopping, please wait...", 3000)
+            return
+        
         # Update UI state
         self.run_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -506,20 +849,102 @@ class OllamaGUI(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
+        if self.batch_checkbox.isChecked():
+            self.run_batch(selected_model, user_input)
+            return
+        
         # Start streaming thread
-        self.stream_thread = StreamingOutputThread(selected_model, user_input)
-        self.stream_thread.update_signal.connect(self.update_output)
-        self.stream_thread.finished_signal.connect(self.generation_finished)
-        self.stream_thread.error_signal.connect(self.show_error)
-        self.stream_thread.start()
+        thread = StreamingOutputThread(selected_model, user_input)
+        thread.update_signal.connect(self.update_output)
+        thread.finished_signal.connect(self.generation_finished)
+        thread.error_signal.connect(self.show_error)
+        self._start_stream_thread(thread)
+
+    def _start_stream_thread(self, thread):
+        """Start a streaming thread, keeping a reference until it has finished"""
+        thread.finished.connect(self._stream_thread_finished)
+        self.stream_threads.append(thread)
+        thread.start()
+
+    def _stream_thread_finished(self):
+        """Drop a finished streaming thread and complete a pending stop"""
+        thread = self.sender()
+        # finished is emitted just before the thread exits, so let it exit fully before release
+        thread.wait()
+        if thread in self.stream_threads:
+            self.stream_threads.remove(thread)
+        if self._stopping and not self.stream_threads:
+            self._stopping = False
+            self.run_button.setEnabled(True)
+            self.status_bar.showMessage("Generation stopped", 3000)
+
+    def run_batch(self, model, user_input):
+        """Run each blank-line separated prompt concurrently"""
+        prompts = [p.strip() for p in user_input.split('\n\n') if p.strip()]
+        self.status_bar.showMessage(f"Running {len(prompts)} prompts on {model}...")
+        self._batch_model = model
+        self._batch_pending = deque(enumerate(prompts))
+        self._batch_remaining = len(prompts)
+        self._last_batch_index = None
+        
+        # Ollama serves concurrent requests from parallel slots, so keep that many in flight
+        for _ in range(min(BATCH_CONCURRENCY, len(prompts))):
+            self._start_next_batch_item()
+
+    def _start_next_batch_item(self):
+        """Start the next queued batch prompt, if any"""
+        if not self._batch_pending:
+            return
+        index, prompt = self._batch_pending.popleft()
+        thread = StreamingOutputThread(self._batch_model, prompt, index=index)
+        thread.batch_update_signal.connect(self.update_batch_output)
+        thread.batch_finished_signal.connect(self.batch_item_finished)
+        thread.batch_error_signal.connect(self.batch_item_error)
+        self._start_stream_thread(thread)
+
+    def update_batch_output(self, index, text):
+        """Append streamed text from one batch prompt, prefixed by its number"""
+        if index != self._last_batch_index:
+            prefix = f"[#{index + 1}] "
+            if not self.output_text_edit.document().isEmpty():
+                prefix = "\n" + prefix
+            text = prefix + text
+            self._last_batch_index = index
+        self.update_output(text)
+
+    def batch_item_finished(self, index):
+        """Handle completion of one batch prompt"""
+        if self._batch_remaining <= 0:
+            # The batch was stopped
+            return
+        self._batch_remaining -= 1
+        if self._batch_remaining == 0:
+            self.generation_finished()
+        else:
+            self._start_next_batch_item()
+
+    def batch_item_error(self, index, error_message):
+        """Show an error from one batch prompt without stopping the others"""
+        self.update_batch_output(index, f"Error: {error_message}")
+        self.batch_item_finished(index)
 
     def update_output(self, text):
         """Update the output text edit with streamed response"""
-        cursor = self.output_text_edit.textCursor()
+        # Append through a separate cursor; moving the widget's own cursor scrolls every time
+        cursor = QTextCursor(self.output_text_edit.document())
         cursor.movePosition(QTextCursor.End)
         cursor.insertText(text)
-        self.output_text_edit.setTextCursor(cursor)
-        self.output_text_edit.ensureCursorVisible()
+
+        # Throttle scrolling so at most one viewport update is pending
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(50, self._scroll_output)
+
+    def _scroll_output(self):
+        """Scroll the output area to show the latest text"""
+        self._scroll_pending = False
+        scroll_bar = self.output_text_edit.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
 
     def generation_finished(self):
         """Handle completion of text generation"""
@@ -530,13 +955,44 @@ class OllamaGUI(QMainWindow):
 
     def stop_generation(self):
         """Stop the current generation"""
-        if self.stream_thread and self.stream_thread.isRunning():
-            self.stream_thread.running = False
-            self.status_bar.showMessage("Generation stopped", 3000)
-            self.run_button.setEnabled(True)
+        if self.stream_threads:
+            self._batch_pending.clear()
+            self._batch_remaining = 0
+            for thread in self.stream_threads:
+                thread.stop()
+            # Generate is re-enabled once every stopped thread has exited
+            self._stopping = True
+            self.status_bar.showMessage("Stopping generation...")
+            self.run_button.setEnabled(False)
             self.stop_button.setEnabled(False)
             self.progress_bar.setVisible(False)
 
+    def closeEvent(self, event):
+        """Interrupt any running workers so nothing keeps running after exit"""
+        threads = []
+        for thread in [self.model_loader] + self.stream_threads + self.findChildren(PullModelThread):
+            try:
+                if thread and thread.isRunning():
+                    threads.append(thread)
+            except RuntimeError:
+                # Underlying Qt object already deleted
+                continue
+
+        for thread in threads:
+            thread.requestInterruption()
+            if isinstance(thread, StreamingOutputThread):
+                thread.stop()
+        still_running = [thread for thread in threads if not thread.wait(200)]
+
+        if still_running:
+            # Destroying a running QThread aborts the process, so hide the window
+            # and try closing again until every worker has exited
+            event.ignore()
+            self.hide()
+            QTimer.singleShot(100, self.close)
+            return
+        super().closeEvent(event)
+
     def show_error(self, error_message):
         """Display error message"""
         QMessageBox.critical(self, "Error", error_message)
@@ -559,21 +1015,21 @@ class OllamaGUI(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, "w", encoding="utf-8") as file:
-                    file.write(content)
+                # Encode once and write the bytes directly, skipping newline translation
+                with open(file_path, "wb") as file:
+                    file.write(content.encode("utf-8"))
                 self.status_bar.showMessage(f"Content saved to {file_path}", 3000)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save content: {e}")
 
     def copy_to_clipboard(self):
         """Copy output content to clipboard"""
-        content = self.output_text_edit.toPlainText()
-        if not content:
+        document = self.output_text_edit.document()
+        if document.isEmpty():
             QMessageBox.warning(self, "Warning", "No content to copy.")
             return
             
-        clipboard = QApplication.clipboard()
-        clipboard.setText(content)
+        QApplication.clipboard().setText(document.toPlainText())
         self.status_bar.showMessage("Content copied to clipboard", 3000)
 
     def clear_content(self):
@@ -591,37 +1047,6 @@ class OllamaGUI(QMainWindow):
             
     def show_about_dialog(self):
         """Show the About dialog with license and credits"""
-        about_text = """
-<h2>Ollama GUI</h2>
-<p>Version 1.0</p>
-<p>A PyQt5-based graphical user interface for interacting with Ollama AI models.</p>
-
-<h3>MIT License</h3>
-<p>Copyright (c) 2025</p>
-
-<p>Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:</p>
-
-<p>The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.</p>
-
-<p>THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.</p>
-
-<h3>Credits</h3>
-<ul>
-<li>Created by Arun K Eswara, eswara.arun@gmail.com
-</ul>
-"""
         about_dialog = QDialog(self)
         about_dialog.setWindowTitle("About Ollama GUI")
         about_dialog.setMinimumWidth(550)
@@ -631,7 +1056,12 @@ SOFTWARE.</p>
         
         about_text_browser = QTextEdit()
         about_text_browser.setReadOnly(True)
-        about_text_browser.setHtml(about_text)
+        # Parse the About HTML once and reuse the document on later opens
+        global _ABOUT_DOC
+        if _ABOUT_DOC is None:
+            _ABOUT_DOC = QTextDocument()
+            _ABOUT_DOC.setHtml(ABOUT_HTML)
+        about_text_browser.setDocument(_ABOUT_DOC)
         layout.addWidget(about_text_browser)
         
         close_button = QPushButton("Close")